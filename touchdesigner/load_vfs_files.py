@@ -24,6 +24,11 @@ def loadWebFilesIntoVFS(comp, publicFolder):
 		publicFolder: Path to folder containing web files
 	"""
 
+	# Buffer log lines and print once at the end - per-line textport
+	# prints are slow enough to dominate a small load
+	log_lines = []
+	_out = log_lines.append
+
 	# Define files to load
 	filesToLoad = [
 		'index.html',
@@ -34,56 +39,91 @@ def loadWebFilesIntoVFS(comp, publicFolder):
 		'builder.js',
 	]
 
-	print("=" * 60)
-	print("[VFS Loader] Loading web files into VFS...")
-	print(f"[VFS Loader] Component: {comp.path}")
-	print(f"[VFS Loader] Source: {publicFolder}")
-	print("=" * 60)
+	_out("=" * 60)
+	_out("[VFS Loader] Loading web files into VFS...")
+	_out(f"[VFS Loader] Component: {comp.path}")
+	_out(f"[VFS Loader] Source: {publicFolder}")
+	_out("=" * 60)
 
 	loadedCount = 0
 	errorCount = 0
 
+	# Enumerate the folder once with scandir instead of stat-ing each file
+	# separately (exists + getsize are one syscall each per file otherwise)
+	try:
+		entries = {e.name: e for e in os.scandir(publicFolder) if e.is_file()}
+	except OSError as e:
+		_out(f"[VFS Loader] ✗ Cannot read folder {publicFolder}: {e}")
+		entries = {}
+
+	# Snapshot VFS names once - 'filename in comp.vfs' walks the whole
+	# collection on every membership test
+	existing_names = {f.name for f in comp.vfs}
+
 	for filename in filesToLoad:
-		filepath = os.path.join(publicFolder, filename)
+		entry = entries.get(filename)
 
 		try:
 			# Check if file exists
-			if not os.path.exists(filepath):
-				print(f"[VFS Loader] ✗ File not found: {filepath}")
+			if entry is None:
+				_out(f"[VFS Loader] ✗ File not found: {os.path.join(publicFolder, filename)}")
 				errorCount += 1
 				continue
 
 			# Check if already in VFS
-			if filename in comp.vfs:
-				print(f"[VFS Loader] ⚠ Replacing existing: {filename}")
+			if filename in existing_names:
+				_out(f"[VFS Loader] ⚠ Replacing existing: {filename}")
 				# Remove old version
 				comp.vfs.deleteFile(filename)
 
 			# Add file to VFS
-			comp.vfs.addFile(filepath, filename)
+			comp.vfs.addFile(entry.path, filename)
+			existing_names.add(filename)
 
-			# Get file size for confirmation
-			fileSize = os.path.getsize(filepath)
-			print(f"[VFS Loader] ✓ Loaded: {filename} ({fileSize:,} bytes)")
+			# Size comes from the scandir entry (stat result is cached)
+			fileSize = entry.stat().st_size
+			_out(f"[VFS Loader] ✓ Loaded: {filename} ({fileSize:,} bytes)")
 			loadedCount += 1
 
 		except Exception as e:
-			print(f"[VFS Loader] ✗ Error loading {filename}: {e}")
+			_out(f"[VFS Loader] ✗ Error loading {filename}: {e}")
 			errorCount += 1
 
-	print("-" * 60)
-	print(f"[VFS Loader] Summary:")
-	print(f"  Loaded: {loadedCount}")
-	print(f"  Errors: {errorCount}")
-	print(f"  Total VFS files: {len(comp.vfs)}")
-	print("=" * 60)
+	# Tell the web server to drop its cached VFS index so fresh files
+	# are served immediately. The callbacks DAT has no fixed name, so
+	# scan the component's DATs for the module exposing the hook.
+	# Non-script DATs (e.g. ui_config JSON) fail to compile as modules
+	# and are skipped.
+	invalidated = False
+	for child in comp.findChildren(type=DAT, maxDepth=1):
+		try:
+			invalidate = getattr(child.module, 'invalidateVfsIndex', None)
+		except Exception:
+			continue
+		if invalidate is not None:
+			invalidate()
+			invalidated = True
+			break
+	if not invalidated:
+		_out("[VFS Loader] ⚠ Could not find the webserver callbacks module -")
+		_out("  its cached VFS index may serve stale files. Re-init the")
+		_out("  component or edit the callbacks DAT to force a module reload.")
+
+	_out("-" * 60)
+	_out(f"[VFS Loader] Summary:")
+	_out(f"  Loaded: {loadedCount}")
+	_out(f"  Errors: {errorCount}")
+	_out(f"  Total VFS files: {len(comp.vfs)}")
+	_out("=" * 60)
 
 	# List all VFS files
 	if len(comp.vfs) > 0:
-		print("[VFS Loader] VFS Contents:")
+		_out("[VFS Loader] VFS Contents:")
 		for vfsFile in comp.vfs:
-			print(f"  - {vfsFile.name} ({vfsFile.size:,} bytes)")
-		print("=" * 60)
+			_out(f"  - {vfsFile.name} ({vfsFile.size:,} bytes)")
+		_out("=" * 60)
+
+	print('\n'.join(map(str, log_lines)))
 
 	return loadedCount, errorCount
 
@@ -157,20 +197,24 @@ def listVFS(comp):
 	Args:
 		comp: TouchDesigner COMP operator
 	"""
-	print("=" * 60)
-	print(f"[VFS] Files in {comp.path}:")
-	print("=" * 60)
+	log_lines = []
+	_out = log_lines.append
+	_out("=" * 60)
+	_out(f"[VFS] Files in {comp.path}:")
+	_out("=" * 60)
 
 	if len(comp.vfs) == 0:
-		print("  (empty)")
+		_out("  (empty)")
 	else:
 		for vfsFile in comp.vfs:
-			print(f"  - {vfsFile.name}")
-			print(f"    Size: {vfsFile.size:,} bytes")
-			print(f"    Path: vfs:{comp.path}/{vfsFile.name}")
-			print()
+			_out(f"  - {vfsFile.name}")
+			_out(f"    Size: {vfsFile.size:,} bytes")
+			_out(f"    Path: vfs:{comp.path}/{vfsFile.name}")
+			_out('')
 
-	print("=" * 60)
+	_out("=" * 60)
+
+	print('\n'.join(map(str, log_lines)))
 
 
 def clearVFS(comp):
@@ -199,29 +243,34 @@ def exportVFS(comp, outputFolder):
 	"""
 	Export all VFS files to a folder on disk.
 
+	Writes run on a small thread pool - file writes release the GIL, so
+	the per-file disk latency overlaps instead of adding up serially.
+
 	Args:
 		comp: TouchDesigner COMP operator
 		outputFolder: Path to export files to
 	"""
 	import os
+	from concurrent.futures import ThreadPoolExecutor
 
 	print(f"[VFS Export] Exporting VFS from {comp.path} to {outputFolder}...")
 
-	# Create output folder if it doesn't exist
-	if not os.path.exists(outputFolder):
-		os.makedirs(outputFolder)
-		print(f"[VFS Export] Created folder: {outputFolder}")
+	# Create output folder if it doesn't exist (single call, no pre-check)
+	os.makedirs(outputFolder, exist_ok=True)
 
-	count = 0
-	for vfsFile in comp.vfs:
-		outputPath = os.path.join(outputFolder, vfsFile.name)
+	# Snapshot bytes on the main thread - VFS access is not thread-safe
+	toWrite = [(os.path.join(outputFolder, f.name), f.name, f.bytes, f.size) for f in comp.vfs]
 
-		# Write bytes to file
+	def _writeOne(item):
+		outputPath, name, data, size = item
 		with open(outputPath, 'wb') as f:
-			f.write(vfsFile.bytes)
+			f.write(data)
+		print(f"[VFS Export] ✓ Exported: {name} ({size:,} bytes)")
 
-		print(f"[VFS Export] ✓ Exported: {vfsFile.name} ({vfsFile.size:,} bytes)")
-		count += 1
+	count = len(toWrite)
+	if count:
+		with ThreadPoolExecutor(max_workers=min(8, count)) as ex:
+			list(ex.map(_writeOne, toWrite))
 
 	print(f"[VFS Export] Exported {count} file(s) to {outputFolder}")
 
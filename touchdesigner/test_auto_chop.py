@@ -20,6 +20,9 @@ WHAT IT DOES:
 
 import json
 
+# Shared decoder instance - skips json.loads' per-call setup
+_decode = json.JSONDecoder().decode
+
 def createAutoChop():
 	"""Create a Constant CHOP automatically from ui_config."""
 
@@ -65,7 +68,7 @@ def createAutoChop():
 	# Step 2: Parse JSON
 	# ========================================================================
 	try:
-		config = json.loads(config_text)
+		config = _decode(config_text)
 	except json.JSONDecodeError as e:
 		print(f"[ERROR] Invalid JSON in ui_config: {e}")
 		return
@@ -42,6 +42,28 @@ import json
 import sys
 import os
 import re
+import time
+import zlib
+from collections import deque, namedtuple
+from functools import lru_cache
+
+# Optional fast JSON backend: orjson is a compiled parser/serializer,
+# roughly 5x faster than stdlib json on config-sized payloads. Stock
+# TouchDesigner Python does not ship it, so fall back to stdlib.
+try:
+	import orjson
+
+	def _loads(s):
+		return orjson.loads(s)
+
+	def _dumps(obj):
+		return orjson.dumps(obj).decode()
+except ImportError:
+	orjson = None
+	# Shared decoder instance: bypasses json.loads' per-call kwarg handling
+	# and decoder-factory setup, which dominates for config-sized payloads
+	_loads = json.JSONDecoder().decode
+	_dumps = json.dumps
 
 # ============================================================================
 # CONFIGURATION
@@ -53,58 +75,327 @@ import re
 #   VFS_COMPONENT = '/project1/WebSocketControl/virtualFile'  # absolute path
 VFS_COMPONENT = 'virtualFile'  # ← UPDATE THIS PATH!
 
+# Precompiled patterns for sanitizeName (compiled once at module load instead
+# of hitting the re cache on every page/control name)
+_RE_NONALNUM = re.compile(r'[^a-zA-Z0-9_]')
+_RE_DUP_US = re.compile(r'_+')
+
+# Translation table for sanitizeName: one C-level pass replaces special
+# characters with '_' AND lowercases in the same step. Covers ASCII only;
+# non-ASCII names fall back to the regex path so behavior stays identical
+# to the JavaScript sanitizer in builder.js.
+_SANITIZE_TBL = str.maketrans(
+	{c: '_' for c in map(chr, range(128)) if not (c.isalnum() or c == '_')}
+	| {c: c.lower() for c in map(chr, range(ord('A'), ord('Z') + 1))}
+)
+
+# Debug logging for the HTTP hot path. Every served file used to emit
+# ~7 synchronous textport prints, which blocks the cook thread under
+# load. _log is a no-op unless _DEBUG is flipped on; errors stay on
+# plain print so they are never swallowed.
+_DEBUG = False
+
+
+def _log(msg, *args):
+	# %-style lazy formatting: callers pass the format and values
+	# separately so nothing is interpolated unless debug is on
+	if _DEBUG:
+		print(msg % args if args else msg)
+
+# Memoized ui_config round-trip: 'hash'/'obj' skip re-parsing unchanged
+# text, and 'serialized' holds the matching JSON string so GET /api/config
+# can answer a polling client without re-serializing the storage dict.
+_CFG_CACHE = {'hash': None, 'obj': None, 'serialized': None}
+
+
+# Cached static-file index: the per-request vfs.find() scan is O(N files)
+# and vfs_file.byteArray materializes a fresh bytes object per access, so
+# each file's fully prepared response (bytes, size, MIME type, ETag) is
+# computed once at index build and handed back verbatim per request.
+# Invalidate when the component changes or files are reloaded.
+_VFS_INDEX = {'comp_id': None, 'map': {}}
+
+
+def invalidateVfsIndex():
+	"""Drop the cached VFS file index (call after reloading VFS files)."""
+	_VFS_INDEX['comp_id'] = None
+	_VFS_INDEX['map'] = {}
+
+
+# Resolved operator cache: op() walks the operator tree by path on every
+# call, so keep hot operators (VFS component, ui_config DAT) resolved and
+# only re-resolve when the cached reference goes invalid.
+_OP_CACHE = {}
+
+
+def _getOp(path):
+	"""Resolve an operator path, caching the result until it goes invalid."""
+	o = _OP_CACHE.get(path)
+	if o is None or not o.valid:
+		o = op(path)
+		# Cache successes only: handlers pass the client-supplied chop
+		# name in here, and caching misses would let every bogus name
+		# from the network grow the dict without bound
+		if o is not None:
+			_OP_CACHE[path] = o
+		else:
+			_OP_CACHE.pop(path, None)
+	return o
+
+
+# Last value written per (chop, channel) key: pointer-drag streams
+# repeat the same position many times, and a duplicate write still
+# propagates through the CHOP graph. Dedupe before touching TD at all.
+# Cleared whenever a deploy or reset writes values behind our back.
+_LAST_VALUE = {}
+
+
+# Deploy channel-plan cache: re-deploying an unchanged config (the
+# common "Save to TD" case) reuses the analyzed per-page channel lists
+# instead of walking every control again. Module-level like the other
+# caches here - a new session just re-analyzes once.
+_PLAN_CACHE = {'key': None, 'pages': {}}
+
+
+# Optional per-frame write coalescing: a dragging slider can deliver
+# several messages within one frame, but TD only renders the last one.
+# When enabled, slider/XY writes land in _PENDING (latest value per
+# channel wins) and flushPending() - wired to an Execute DAT's
+# onFrameStart next to the Web Server DAT - performs one write per
+# channel per frame. OFF by default: without the Execute DAT wired,
+# pending values would never reach the CHOPs. Buttons and reset always
+# write immediately.
+_COALESCE_WRITES = False
+_PENDING = {}
+
+
+def flushPending():
+	"""Write the latest pending value per channel (call from onFrameStart)."""
+	if not _PENDING:
+		return
+	for (chop_name, idx), value in _PENDING.items():
+		chop = _getOp(chop_name)
+		if chop is not None:
+			chop.par[_VALUE_PARAMS[idx]] = value
+	_PENDING.clear()
+
+
+# Per-CHOP channel-name -> slot-index maps. Every const{i}name .eval()
+# crosses the Python/TD boundary, so the O(numChans) scan per inbound
+# message becomes a one-time build plus a dict hit. Keyed by (chop.id,
+# chop.numChans) so a deploy that changes the channel count rolls the
+# key over automatically; deployFromConfig clears the cache outright to
+# cover renames at the same count.
+_CHAN_INDEX_CACHE = {}
+
+
+def _chanIndexMap(chop):
+	"""Return the {channel_name: slot_index} map for a Constant CHOP."""
+	n = chop.numChans
+	key = (chop.id, n)
+	m = _CHAN_INDEX_CACHE.get(key)
+	if m is None:
+		if n > len(_NAME_PARAMS):
+			_growParamNames(n)
+		m = {chop.par[_NAME_PARAMS[i]].eval(): i for i in range(n)}
+		_CHAN_INDEX_CACHE[key] = m
+	return m
+
+
+# Root-ish URIs that map straight to the viewer page
+_URI_ALIASES = {'': 'index.html', '/': 'index.html'}
+
+
+# Banner separators bound once instead of re-evaluating the repeat
+# expression at every log site
+_BANNER_EQ = "=" * 60
+_BANNER_DASH = "-" * 60
+_BANNER_EQ70 = "=" * 70
+_BANNER_DASH70 = "-" * 70
+
+
+# Fixed JSON replies serialized once at import instead of per request
+_DEFAULT_CONFIG_JSON = _dumps({
+	"version": "1.0",
+	"pages": [{"id": "page1", "name": "Default", "controls": []}]
+})
+_SAVE_OK_JSON = _dumps({"success": True, "message": "Config saved"})
+
+
+# Legacy hardcoded slider names -> Constant CHOP value parameters
+_LEGACY_SLIDER_MAP = {'slider1': 'value0', 'slider2': 'value1', 'slider3': 'value2'}
+
+
+# Default values written by handleReset: sliders to midpoint, color to
+# red, XY to center. One table drives the loop, so adding a CHOP to the
+# reset means adding a row here.
+_RESET_TABLE = (
+	('constant_params', (('value0', 50), ('value1', 50), ('value2', 50))),
+	('constant_color', (('value0', 1.0), ('value1', 0.0), ('value2', 0.0))),
+	('constant_xy', (('value0', 0.5), ('value1', 0.5))),
+)
+
+
+# Legacy Text DATs can hold raw bytes or a stringified bytes repr ("b'...'")
+_BYTES_PREFIXES = ("b'", 'b"')
+
+
+def _normalizeConfigText(config_text):
+	"""Normalize ui_config DAT text: decode bytes and unwrap bytes-repr strings."""
+	# type() is faster than isinstance() and the DAT only ever hands us str/bytes
+	if type(config_text) is not str:
+		config_text = config_text.decode('utf-8')
+
+	# Single slice comparison instead of two startswith calls
+	if config_text[:2] in _BYTES_PREFIXES:
+		config_text = config_text[2:-1].encode().decode('unicode_escape')
+
+	return config_text
+
+
+def _parseConfigText(config_text):
+	"""Parse ui_config JSON, reusing the cached result when the text is unchanged."""
+	h = hash(config_text)
+	if _CFG_CACHE['hash'] == h:
+		return _CFG_CACHE['obj']
+	obj = _loads(config_text)
+	_CFG_CACHE['hash'] = h
+	_CFG_CACHE['obj'] = obj
+	return obj
+
+
+# Memoized DAT round-trip: keyed on the raw DAT text so the bytes
+# detection/unescape dance and the JSON parse each run once per edit,
+# not once per request.
+_DAT_CACHE = {'hash': None, 'text': None, 'obj': None}
+
+
+def _loadConfigFromDat(config_dat):
+	"""Load the config from a Text DAT, memoized on its raw text.
+
+	Returns (normalized_text, parsed_dict). Raises ValueError on bad JSON.
+	"""
+	raw = config_dat.text
+	h = hash(raw)
+	if _DAT_CACHE['hash'] != h:
+		text = _normalizeConfigText(raw)
+		_DAT_CACHE['obj'] = _parseConfigText(text)
+		_DAT_CACHE['text'] = text
+		_DAT_CACHE['hash'] = h
+	return _DAT_CACHE['text'], _DAT_CACHE['obj']
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# MIME types by extension - one dict lookup instead of an endswith chain
+_MIME = {
+	'.html': 'text/html',
+	'.css': 'text/css',
+	'.js': 'application/javascript',
+	'.json': 'application/json',
+	'.png': 'image/png',
+	'.jpg': 'image/jpeg',
+	'.jpeg': 'image/jpeg',
+	'.svg': 'image/svg+xml',
+	'.ico': 'image/x-icon',
+}
+
+
 def getMimeType(filename):
 	"""Get MIME type based on file extension."""
-	if filename.endswith('.html'):
-		return 'text/html'
-	elif filename.endswith('.css'):
-		return 'text/css'
-	elif filename.endswith('.js'):
-		return 'application/javascript'
-	elif filename.endswith('.json'):
-		return 'application/json'
-	elif filename.endswith('.png'):
-		return 'image/png'
-	elif filename.endswith('.jpg') or filename.endswith('.jpeg'):
-		return 'image/jpeg'
-	elif filename.endswith('.svg'):
-		return 'image/svg+xml'
-	elif filename.endswith('.ico'):
-		return 'image/x-icon'
-	else:
-		return 'application/octet-stream'
+	# splitext handles the no-dot case cleanly (rfind(-1) would slice
+	# the last character instead) and is one C-level call
+	return _MIME.get(os.path.splitext(filename)[1].lower(), 'application/octet-stream')
 
 
+@lru_cache(maxsize=512)
 def sanitizeName(name):
 	"""Sanitize page name for use as CHOP name."""
-	# Remove special characters, replace spaces with underscore
-	sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-	# Remove consecutive underscores
-	sanitized = re.sub(r'_+', '_', sanitized)
-	# Remove leading/trailing underscores
-	sanitized = sanitized.strip('_')
-	# Lowercase
-	sanitized = sanitized.lower()
+	if name.isascii():
+		# Fast path: single translate pass replaces specials and lowercases
+		sanitized = name.translate(_SANITIZE_TBL)
+		# Collapse runs of underscores (C-level replace, no regex)
+		while '__' in sanitized:
+			sanitized = sanitized.replace('__', '_')
+		sanitized = sanitized.strip('_')
+	else:
+		# Non-ASCII: regex path, identical behavior to builder.js sanitizer
+		sanitized = _RE_DUP_US.sub('_', _RE_NONALNUM.sub('_', name)).strip('_').lower()
 	return sanitized if sanitized else 'page'
 
 
+# Multiply by the reciprocal instead of dividing per component
+_INV255 = 1.0 / 255.0
+
+# Constant CHOP channel slot count (const0..const39 in current TD builds)
+_CONST_CHOP_CAPACITY = 40
+
+# Pre-built parameter-name strings indexed by slot: chop.par[f'const{i}value']
+# allocates and hashes a fresh string per message, a tuple index hands back
+# the same interned one. Grown on demand for CHOPs with more slots.
+_NAME_PARAMS = tuple(f'const{i}name' for i in range(_CONST_CHOP_CAPACITY))
+_VALUE_PARAMS = tuple(f'const{i}value' for i in range(_CONST_CHOP_CAPACITY))
+
+
+def _growParamNames(n):
+	global _NAME_PARAMS, _VALUE_PARAMS
+	_NAME_PARAMS = tuple(f'const{i}name' for i in range(n))
+	_VALUE_PARAMS = tuple(f'const{i}value' for i in range(n))
+
+
 def hexToRGB(hex_color):
 	"""Convert hex color to normalized RGB (0-1)."""
-	hex_color = hex_color.lstrip('#')
-
 	try:
-		r = int(hex_color[0:2], 16) / 255.0
-		g = int(hex_color[2:4], 16) / 255.0
-		b = int(hex_color[4:6], 16) / 255.0
-		return (r, g, b)
-	except:
+		# One C-level hex parse instead of three int(..., 16) slices
+		b = bytes.fromhex(hex_color.lstrip('#')[:6])
+		return (b[0] * _INV255, b[1] * _INV255, b[2] * _INV255)
+	except Exception:
 		return (1.0, 0.0, 0.0)  # Default red
 
 
+# Lightweight channel descriptor: a namedtuple is a fraction of a dict's
+# footprint and field access goes through a C slot, which matters when a
+# deploy emits a few channels per control across many pages
+Channel = namedtuple('Channel', 'name value type')
+
+
+# Channel emitters: one per control type, dispatched via _CHANNEL_EMITTERS
+# below instead of an if/elif chain per control
+
+def _emitSlider(control, sanitized_label, channels):
+	"""Slider = 1 channel."""
+	channels.append(Channel(sanitized_label, control.get('default', 50), 'slider'))
+
+
+def _emitColor(control, sanitized_label, channels):
+	"""Color = 3 channels (r, g, b), hex default converted to 0-1 RGB."""
+	r, g, b = hexToRGB(control.get('default', '#ff0000'))
+	channels.append(Channel(f"{sanitized_label}_r", r, 'color'))
+	channels.append(Channel(f"{sanitized_label}_g", g, 'color'))
+	channels.append(Channel(f"{sanitized_label}_b", b, 'color'))
+
+
+def _emitXY(control, sanitized_label, channels):
+	"""XY = 2 channels (x, y)."""
+	default_xy = control.get('default', {'x': 0.5, 'y': 0.5})
+	channels.append(Channel(f"{sanitized_label}_x", default_xy.get('x', 0.5), 'xy'))
+	channels.append(Channel(f"{sanitized_label}_y", default_xy.get('y', 0.5), 'xy'))
+
+
+def _emitButton(control, sanitized_label, channels):
+	"""Button = 1 channel (0 or 1)."""
+	channels.append(Channel(f"{sanitized_label}_state", control.get('default', 0), 'button'))
+
+
+_CHANNEL_EMITTERS = {
+	'slider': _emitSlider,
+	'color': _emitColor,
+	'xy': _emitXY,
+	'button': _emitButton,
+}
+
+
 def deployFromConfig():
 	"""
 	Deploy CHOPs from ui_config Text DAT.
@@ -120,9 +411,19 @@ def deployFromConfig():
 	Returns dict with deployment results.
 	"""
 
-	print("=" * 70)
-	print("[Deploy CHOPs] Starting deployment...")
-	print("=" * 70)
+	# Buffer log lines and emit them in one print per exit - every print
+	# grabs the textport lock, and a deploy can log dozens of lines
+	log_lines = []
+	_out = log_lines.append
+
+	def _flush():
+		if log_lines:
+			print('\n'.join(map(str, log_lines)))
+			log_lines.clear()
+
+	_out(_BANNER_EQ70)
+	_out("[Deploy CHOPs] Starting deployment...")
+	_out(_BANNER_EQ70)
 
 	results = {
 		'success': False,
@@ -138,53 +439,68 @@ def deployFromConfig():
 	# PRIMARY: Try storage first (fast, reliable)
 	if 'ui_config' in parent().storage:
 		config = parent().storage['ui_config']
-		print(f"[Deploy] ✓ Loaded config from storage")
+		_out(f"[Deploy] ✓ Loaded config from storage")
 
 	# FALLBACK: Try Text DAT (for old projects or manual edits)
 	else:
-		config_dat = op('ui_config')
+		config_dat = _getOp('ui_config')
 
 		if config_dat is None:
 			error = "ui_config not found (no storage or Text DAT)"
-			print(f"[ERROR] {error}")
+			_out(f"[ERROR] {error}")
 			results['errors'].append(error)
+			_flush()
 			return results
 
 		config_text = config_dat.text
 
 		if not config_text:
 			error = "ui_config is empty - save a configuration first"
-			print(f"[ERROR] {error}")
+			_out(f"[ERROR] {error}")
 			results['errors'].append(error)
+			_flush()
 			return results
 
-		# Handle bytes or string representation of bytes
-		if isinstance(config_text, bytes):
-			config_text = config_text.decode('utf-8')
-
-		if config_text.startswith("b'") or config_text.startswith('b"'):
-			config_text = config_text[2:-1]
-			config_text = config_text.encode().decode('unicode_escape')
-
 		try:
-			config = json.loads(config_text)
-			print(f"[Deploy] ✓ Loaded config from Text DAT (fallback)")
-		except json.JSONDecodeError as e:
+			# Bytes detection and parse are memoized on the DAT text
+			_, config = _loadConfigFromDat(config_dat)
+			_out(f"[Deploy] ✓ Loaded config from Text DAT (fallback)")
+		except ValueError as e:
 			error = f"Invalid JSON in ui_config: {e}"
-			print(f"[ERROR] {error}")
+			_out(f"[ERROR] {error}")
 			results['errors'].append(error)
+			_flush()
 			return results
 
 	pages = config.get('pages', [])
 
 	if not pages:
 		warning = "No pages found in config"
-		print(f"[WARNING] {warning}")
+		_out(f"[WARNING] {warning}")
 		results['warnings'].append(warning)
 		results['success'] = True
+		_flush()
 		return results
 
-	print(f"[OK] Found {len(pages)} page(s) in config")
+	_out(f"[OK] Found {len(pages)} page(s) in config")
+
+	# Keyed by the serialized config, so any builder edit invalidates
+	# the plan. Reuse the config cache's hash when the dict came
+	# straight from it.
+	if config is _CFG_CACHE['obj'] and _CFG_CACHE['hash'] is not None:
+		plan_key = _CFG_CACHE['hash']
+	else:
+		plan_key = hash(_dumps(config))
+
+	if _PLAN_CACHE['key'] == plan_key:
+		page_plans = _PLAN_CACHE['pages']
+		_out("[Deploy] ✓ Reusing cached channel plan (config unchanged)")
+	else:
+		page_plans = None
+	new_plans = {}
+
+	# Drop the plan key older builds persisted into component storage
+	parent().storage.pop('ui_deploy_plan', None)
 
 	# ========================================================================
 	# Step 2: Get deployment location (inside component)
@@ -193,87 +509,71 @@ def deployFromConfig():
 	# me.parent() = inside the component, same level as webserver
 	try:
 		deploy_location = me.parent()
-		print(f"[OK] Deploy location: {deploy_location.path}")
+		_out(f"[OK] Deploy location: {deploy_location.path}")
 	except:
 		# Fallback if called from elsewhere
 		deploy_location = parent()
-		print(f"[OK] Deploy location (fallback): {deploy_location.path}")
+		_out(f"[OK] Deploy location (fallback): {deploy_location.path}")
 
 	# ========================================================================
 	# Step 3: Deploy CHOP for each page
 	# ========================================================================
+	# Cosmetic setup (position, viewer) is deferred until after all channels
+	# are written - enabling the viewer mid-loop makes TD refresh the node
+	# synchronously and cook dependents once per page.
+	created_chops = []
+
 	for page_idx, page in enumerate(pages):
 		page_name = page.get('name', f'Page {page_idx + 1}')
 		page_id = page.get('id', f'page{page_idx + 1}')
 		controls = page.get('controls', [])
 
-		print("-" * 70)
-		print(f"[Page {page_idx + 1}] Processing '{page_name}' ({len(controls)} controls)")
+		_out(_BANNER_DASH70)
+		_out(f"[Page {page_idx + 1}] Processing '{page_name}' ({len(controls)} controls)")
 
 		if not controls:
 			warning = f"Page '{page_name}' has no controls - skipping"
-			print(f"[WARNING] {warning}")
+			_out(f"[WARNING] {warning}")
 			results['warnings'].append(warning)
 			continue
 
 		# Generate CHOP name from page name
 		chop_name = f"{sanitizeName(page_name)}_controls"
-		print(f"[INFO] CHOP name: '{chop_name}'")
+		_out(f"[INFO] CHOP name: '{chop_name}'")
 
 		# Check if CHOP already exists
 		existing_chop = deploy_location.op(chop_name)
 		is_update = existing_chop is not None
 
 		if is_update:
-			print(f"[INFO] CHOP '{chop_name}' exists - will update")
+			_out(f"[INFO] CHOP '{chop_name}' exists - will update")
 		else:
-			print(f"[INFO] CHOP '{chop_name}' does not exist - will create")
-
-		# Analyze controls and build channel list
-		channels = []
-
-		for control in controls:
-			control_type = control.get('type')
-			control_id = control.get('id', 'unknown')
-			control_label = control.get('label', control_id)
-
-			# Use sanitized label for channel names (human-readable)
-			sanitized_label = sanitizeName(control_label)
-
-			if control_type == 'slider':
-				# Slider = 1 channel
-				channels.append({
-					'name': sanitized_label,
-					'value': control.get('default', 50),
-					'type': 'slider'
-				})
-
-			elif control_type == 'color':
-				# Color = 3 channels (r, g, b)
-				default_hex = control.get('default', '#ff0000')
-				# Convert hex to RGB (0-1)
-				r, g, b = hexToRGB(default_hex)
-				channels.append({'name': f"{sanitized_label}_r", 'value': r, 'type': 'color'})
-				channels.append({'name': f"{sanitized_label}_g", 'value': g, 'type': 'color'})
-				channels.append({'name': f"{sanitized_label}_b", 'value': b, 'type': 'color'})
-
-			elif control_type == 'xy':
-				# XY = 2 channels (x, y)
-				default_xy = control.get('default', {'x': 0.5, 'y': 0.5})
-				channels.append({'name': f"{sanitized_label}_x", 'value': default_xy.get('x', 0.5), 'type': 'xy'})
-				channels.append({'name': f"{sanitized_label}_y", 'value': default_xy.get('y', 0.5), 'type': 'xy'})
-
-			elif control_type == 'button':
-				# Button = 1 channel (0 or 1)
-				channels.append({
-					'name': f"{sanitized_label}_state",
-					'value': control.get('default', 0),
-					'type': 'button'
-				})
+			_out(f"[INFO] CHOP '{chop_name}' does not exist - will create")
+
+		# Analyze controls and build channel list (or reuse the cached plan)
+		channels = page_plans.get(page_idx) if page_plans is not None else None
+
+		if channels is None:
+			channels = []
+
+			for control in controls:
+				control_type = control.get('type')
+				control_id = control.get('id', 'unknown')
+				control_label = control.get('label', control_id)
+
+				# Use sanitized label for channel names (human-readable)
+				sanitized_label = sanitizeName(control_label)
+
+				# Dispatch to the per-type channel emitter (unknown types skipped)
+				emitter = _CHANNEL_EMITTERS.get(control_type)
+				if emitter is not None:
+					emitter(control, sanitized_label, channels)
+
+			new_plans[page_idx] = channels
 
 		if not channels:
 			warning = f"Page '{page_name}' has no deployable controls"
-			print(f"[WARNING] {warning}")
+			_out(f"[WARNING] {warning}")
 			results['warnings'].append(warning)
 			continue
 
@@ -282,37 +582,64 @@ def deployFromConfig():
 			if is_update:
 				# Use existing CHOP - just overwrite the channels we need
 				new_chop = existing_chop
-				print(f"[INFO] Updating CHOP with {len(channels)} channels")
+				_out(f"[INFO] Updating CHOP with {len(channels)} channels")
 			else:
 				# Create new CHOP
 				new_chop = deploy_location.create(constantCHOP, chop_name)
-				print(f"[INFO] Creating CHOP with {len(channels)} channels")
-
-			# Configure channels (set the ones we need, leave the rest alone)
-			for i, channel in enumerate(channels):
-				name_param = f'const{i}name'
-				value_param = f'const{i}value'
-
-				if hasattr(new_chop.par, name_param):
-					setattr(new_chop.par, name_param, channel['name'])
-					setattr(new_chop.par, value_param, channel['value'])
-					print(f"  [{i}] {channel['name']} = {channel['value']} ({channel['type']})")
-				else:
-					warning = f"Channel {i} exceeded CHOP capacity"
-					print(f"[WARNING] {warning}")
-					results['warnings'].append(warning)
-					break
-
-			# Position CHOP (only for new CHOPs)
+				_out(f"[INFO] Creating CHOP with {len(channels)} channels")
+
+			# Drop any cached resolution for this name so the WebSocket
+			# handlers re-resolve to the freshly deployed CHOP
+			_OP_CACHE.pop(chop_name, None)
+
+			# Cap at the known slot count up front with a single warning
+			# instead of probing each slot's existence inside the loop
+			if len(channels) > _CONST_CHOP_CAPACITY:
+				warning = f"Page '{page_name}' needs {len(channels)} channels - capped at {_CONST_CHOP_CAPACITY}"
+				_out(f"[WARNING] {warning}")
+				results['warnings'].append(warning)
+				channels = channels[:_CONST_CHOP_CAPACITY]
+
+			# Pre-size the 'const' parameter sequence in one call so TD does
+			# not reallocate channel storage as slots fill in one by one.
+			# Older builds expose a fixed 40-slot bank instead of a sequence;
+			# there this is a harmless no-op.
+			try:
+				const_seq = new_chop.seq.const
+				if const_seq.numBlocks < len(channels):
+					const_seq.numBlocks = len(channels)
+			except Exception:
+				pass
+
+			# Configure channels (set the ones we need, leave the rest alone).
+			# pars() returns all matching parameter objects in one call, so
+			# fetch the name/value banks once instead of a getattr pair per
+			# slot - each .par attribute access crosses the Python/C++
+			# boundary. Sorted numerically because pars() orders const10
+			# before const2 lexically.
+			name_pars = sorted(new_chop.pars('const*name'), key=lambda p: int(p.name[5:-4]))
+			value_pars = sorted(new_chop.pars('const*value'), key=lambda p: int(p.name[5:-5]))
+
+			for i, (name_par, value_par, channel) in enumerate(zip(name_pars, value_pars, channels)):
+				name_par.val = channel.name
+				value_par.val = channel.value
+				_out(f"  [{i}] {channel.name} = {channel.value} ({channel.type})")
+
+			# zip stops at the shorter sequence - flag any channels that
+			# did not fit in the available slots
+			if len(name_pars) < len(channels):
+				warning = f"Channel {len(name_pars)} exceeded CHOP capacity"
+				_out(f"[WARNING] {warning}")
+				results['warnings'].append(warning)
+
+			# Position/viewer handled after the loop (only for new CHOPs)
 			if not is_update:
-				new_chop.nodeX = page_idx * 200
-				new_chop.nodeY = -200
-				new_chop.viewer = True
+				created_chops.append((new_chop, page_idx))
 
 			# Success message
 			action = "Updated" if is_update else "Created"
 			success_msg = f"{action} '{chop_name}' with {len(channels)} channels"
-			print(f"[SUCCESS] {success_msg}")
+			_out(f"[SUCCESS] {success_msg}")
 
 			results['chops'].append({
 				'name': chop_name,
@@ -325,32 +652,51 @@ def deployFromConfig():
 		except Exception as e:
 			action = "update" if is_update else "create"
 			error = f"Failed to {action} CHOP '{chop_name}': {e}"
-			print(f"[ERROR] {error}")
+			_out(f"[ERROR] {error}")
 			results['errors'].append(error)
 
+	# Keep the freshly built plan for the next deploy of this config
+	if page_plans is None:
+		_PLAN_CACHE['key'] = plan_key
+		_PLAN_CACHE['pages'] = new_plans
+
+	# Channel names and values may have changed - drop the handlers'
+	# name->index maps, the duplicate-write memo, and any queued
+	# coalesced writes whose slot meaning may have shifted
+	_CHAN_INDEX_CACHE.clear()
+	_LAST_VALUE.clear()
+	_PENDING.clear()
+
+	# Single cosmetic pass for newly created CHOPs
+	for new_chop, page_idx in created_chops:
+		new_chop.nodeX = page_idx * 200
+		new_chop.nodeY = -200
+		new_chop.viewer = True
+
 	# ========================================================================
 	# Step 4: Summary
 	# ========================================================================
-	print("=" * 70)
-	print(f"[Deploy CHOPs] Deployment complete!")
+	_out(_BANNER_EQ70)
+	_out(f"[Deploy CHOPs] Deployment complete!")
 
 	# Count created vs updated
 	created = [c for c in results['chops'] if c.get('action') == 'Created']
 	updated = [c for c in results['chops'] if c.get('action') == 'Updated']
 
 	if created:
-		print(f"[Deploy CHOPs] Created: {len(created)} CHOP(s)")
+		_out(f"[Deploy CHOPs] Created: {len(created)} CHOP(s)")
 	if updated:
-		print(f"[Deploy CHOPs] Updated: {len(updated)} CHOP(s)")
+		_out(f"[Deploy CHOPs] Updated: {len(updated)} CHOP(s)")
 	if not created and not updated:
-		print(f"[Deploy CHOPs] No CHOPs processed")
+		_out(f"[Deploy CHOPs] No CHOPs processed")
 
-	print(f"[Deploy CHOPs] Errors: {len(results['errors'])}")
-	print(f"[Deploy CHOPs] Warnings: {len(results['warnings'])}")
-	print("=" * 70)
+	_out(f"[Deploy CHOPs] Errors: {len(results['errors'])}")
+	_out(f"[Deploy CHOPs] Warnings: {len(results['warnings'])}")
+	_out(_BANNER_EQ70)
 
 	results['success'] = len(results['errors']) == 0
 
+	_flush()
 	return results
 
 # ============================================================================
@@ -373,7 +719,7 @@ def onHTTPRequest(webServerDAT, request, response):
 	uri = request.get('uri', '/')
 	method = request.get('method', 'GET')
 
-	print(f"[WebServer] {method} {uri}")
+	_log("[WebServer] %s %s", method, uri)
 
 	# ========================================================================
 	# API: GET /api/config - Load UI configuration
@@ -383,53 +729,57 @@ def onHTTPRequest(webServerDAT, request, response):
 			# PRIMARY: Try storage first (fast, reliable)
 			if 'ui_config' in parent().storage:
 				config = parent().storage['ui_config']
+
+				# Reuse the serialized form while it still matches the
+				# stored dict - skips a full dumps per poll
+				if config is _CFG_CACHE['obj'] and _CFG_CACHE['serialized'] is not None:
+					data = _CFG_CACHE['serialized']
+				else:
+					# POST saves the raw body alongside the dict - serve it
+					# back without re-serializing. Unlike the in-module
+					# cache, this survives a .toe reload.
+					data = parent().storage.get('ui_config_json')
+					if data is None:
+						data = _dumps(config)
+					_CFG_CACHE['hash'] = hash(data)
+					_CFG_CACHE['obj'] = config
+					_CFG_CACHE['serialized'] = data
+
 				response['statusCode'] = 200
 				response['statusReason'] = 'OK'
-				response['data'] = json.dumps(config)
-				print(f"[WebServer] ✓ Loaded config from storage")
+				response['data'] = data
+				_log("[WebServer] ✓ Loaded config from storage")
 
 			# FALLBACK: Try Text DAT (for old projects or manual edits)
-			elif (config_dat := op('ui_config')) is not None:
+			elif (config_dat := _getOp('ui_config')) is not None:
 				config_text = config_dat.text
 
 				if not config_text or config_text.strip() == '':
-					print("[WebServer] ui_config is empty - using default")
+					_log("[WebServer] ui_config is empty - using default")
 					response['statusCode'] = 200
 					response['statusReason'] = 'OK'
-					response['data'] = json.dumps({
-						"version": "1.0",
-						"pages": [{"id": "page1", "name": "Default", "controls": []}]
-					})
+					response['data'] = _DEFAULT_CONFIG_JSON
 				else:
-					# Handle bytes format (if needed)
-					if isinstance(config_text, bytes):
-						config_text = config_text.decode('utf-8')
-
-					if config_text.startswith("b'") or config_text.startswith('b"'):
-						config_text = config_text[2:-1]
-						config_text = config_text.encode().decode('unicode_escape')
-
 					try:
-						json.loads(config_text)  # Validate
+						# Normalization and validation are memoized on the
+						# DAT text, so unchanged text costs one hash
+						config_text, _ = _loadConfigFromDat(config_dat)
 						response['statusCode'] = 200
 						response['statusReason'] = 'OK'
 						response['data'] = config_text
-						print(f"[WebServer] ✓ Loaded config from Text DAT (fallback)")
-					except json.JSONDecodeError:
+						_log("[WebServer] ✓ Loaded config from Text DAT (fallback)")
+					except ValueError:
 						print("[WebServer] Error: Text DAT contains invalid JSON")
 						response['statusCode'] = 500
 						response['statusReason'] = 'Internal Server Error'
-						response['data'] = json.dumps({"error": "Invalid JSON in Text DAT"})
+						response['data'] = _dumps({"error": "Invalid JSON in Text DAT"})
 
 			# EMPTY: No storage, no Text DAT
 			else:
-				print("[WebServer] No config found - using empty default")
+				_log("[WebServer] No config found - using empty default")
 				response['statusCode'] = 200
 				response['statusReason'] = 'OK'
-				response['data'] = json.dumps({
-					"version": "1.0",
-					"pages": [{"id": "page1", "name": "Default", "controls": []}]
-				})
+				response['data'] = _DEFAULT_CONFIG_JSON
 
 			response['content-type'] = 'application/json'
 			return response
@@ -438,7 +788,7 @@ def onHTTPRequest(webServerDAT, request, response):
 			print(f"[WebServer] Error in GET /api/config: {e}")
 			response['statusCode'] = 500
 			response['statusReason'] = 'Internal Server Error'
-			response['data'] = json.dumps({"error": str(e)})
+			response['data'] = _dumps({"error": str(e)})
 			response['content-type'] = 'application/json'
 			return response
 
@@ -449,31 +799,44 @@ def onHTTPRequest(webServerDAT, request, response):
 		try:
 			config_json = request.get('data', '')
 
+			# Decode once up front (some TD versions hand POST data as bytes)
+			if isinstance(config_json, bytes):
+				config_json = config_json.decode('utf-8')
+
 			try:
-				# Parse and validate JSON
-				config_dict = json.loads(config_json)
+				# Parse and validate JSON - parsed once, reused below
+				config_dict = _loads(config_json)
 
-				# PRIMARY: Save to storage (fast, reliable, no encoding issues)
+				# PRIMARY: Save to storage (fast, reliable, no encoding issues).
+				# The raw JSON string is kept beside the dict so GET can
+				# answer without a re-dumps, even after a .toe reload.
 				parent().storage['ui_config'] = config_dict
-				print(f"[WebServer] ✓ Saved config to storage ({len(config_json)} bytes)")
+				parent().storage['ui_config_json'] = config_json
+				_log("[WebServer] ✓ Saved config to storage (%d bytes)", len(config_json))
+
+				# Cache the validated round-trip: GET serves the raw body
+				# back and deploy reuses the parsed dict
+				_CFG_CACHE['hash'] = hash(config_json)
+				_CFG_CACHE['obj'] = config_dict
+				_CFG_CACHE['serialized'] = config_json
 
 				# BACKUP: Save to Text DAT (visible in UI)
-				config_dat = op('ui_config')
+				# Pretty-print only for the human-readable backup; skip
+				# silently in storage-only setups.
+				config_dat = _getOp('ui_config')
 				if config_dat is not None:
 					config_dat.text = json.dumps(config_dict, indent=2)
-					print(f"[WebServer] ✓ Saved config to Text DAT (backup)")
-				else:
-					print(f"[WebServer] ⚠ ui_config DAT not found, storage-only mode")
+					_log("[WebServer] ✓ Saved config to Text DAT (backup)")
 
 				response['statusCode'] = 200
 				response['statusReason'] = 'OK'
-				response['data'] = json.dumps({"success": True, "message": "Config saved"})
+				response['data'] = _SAVE_OK_JSON
 
-			except json.JSONDecodeError as e:
+			except ValueError as e:
 				print(f"[WebServer] Error: Invalid JSON - {e}")
 				response['statusCode'] = 400
 				response['statusReason'] = 'Bad Request'
-				response['data'] = json.dumps({"error": "Invalid JSON", "details": str(e)})
+				response['data'] = _dumps({"error": "Invalid JSON", "details": str(e)})
 
 			response['content-type'] = 'application/json'
 			return response
@@ -482,7 +845,7 @@ def onHTTPRequest(webServerDAT, request, response):
 			print(f"[WebServer] Error in POST /api/config: {e}")
 			response['statusCode'] = 500
 			response['statusReason'] = 'Internal Server Error'
-			response['data'] = json.dumps({"error": str(e)})
+			response['data'] = _dumps({"error": str(e)})
 			response['content-type'] = 'application/json'
 			return response
 
@@ -497,8 +860,8 @@ def onHTTPRequest(webServerDAT, request, response):
 			# Return results
 			response['statusCode'] = 200 if results['success'] else 500
 			response['statusReason'] = 'OK' if results['success'] else 'Internal Server Error'
-			response['data'] = json.dumps(results)
-			print(f"[WebServer] Deploy complete: {len(results['chops'])} CHOP(s) processed, {len(results['errors'])} error(s)")
+			response['data'] = _dumps(results)
+			_log("[WebServer] Deploy complete: %d CHOP(s) processed, %d error(s)", len(results['chops']), len(results['errors']))
 
 			response['content-type'] = 'application/json'
 			return response
@@ -507,7 +870,7 @@ def onHTTPRequest(webServerDAT, request, response):
 			print(f"[WebServer] Error in POST /api/deploy: {e}")
 			response['statusCode'] = 500
 			response['statusReason'] = 'Internal Server Error'
-			response['data'] = json.dumps({"error": str(e), "success": False, "chops": [], "errors": [str(e)], "warnings": []})
+			response['data'] = _dumps({"error": str(e), "success": False, "chops": [], "errors": [str(e)], "warnings": []})
 			response['content-type'] = 'application/json'
 			return response
 
@@ -516,13 +879,23 @@ def onHTTPRequest(webServerDAT, request, response):
 	# ========================================================================
 	else:
 		try:
-			# Map URI to filename
-			filename = uri.lstrip('/')  # Remove leading slash
-			if filename == '' or filename == '/':
-				filename = 'index.html'
+			# Map URI to filename: strip any query string, then resolve the
+			# root aliases with one dict lookup instead of two compares
+			path = uri.split('?', 1)[0]
+			filename = _URI_ALIASES.get(path) or path.lstrip('/')
+
+			# Reject traversal attempts and obvious non-asset probes
+			# (bot/scanner paths with no extension or backslashes) before
+			# touching the VFS component - a few string checks instead of
+			# component resolution and index work
+			if '..' in filename or '\\' in filename or '.' not in filename:
+				response['statusCode'] = 404
+				response['statusReason'] = 'Not Found'
+				response['data'] = f'File not found: {filename}'
+				return response
 
 			# Get VFS component
-			vfs_comp = op(VFS_COMPONENT)
+			vfs_comp = _getOp(VFS_COMPONENT)
 
 			if vfs_comp is None:
 				print(f"[WebServer] Error: VFS component '{VFS_COMPONENT}' not found!")
@@ -532,60 +905,122 @@ def onHTTPRequest(webServerDAT, request, response):
 				response['data'] = 'VFS component not found - check callback script configuration'
 				return response
 
-			# Try to get file from VFS
-			# Use .find() to get list of VFSFile objects (official API)
-			vfs_file = None
-			all_vfs_files = vfs_comp.vfs.find()  # Returns list of VFSFile objects
-
-			for file_obj in all_vfs_files:
-				# file_obj.name is just the filename (portable!)
-				if file_obj.name == filename:
-					vfs_file = file_obj
-					break
-
-			if vfs_file is None:
-				print(f"[WebServer] Error: File '{filename}' not found in VFS")
-				print(f"[WebServer] Available files:")
-				for file_obj in all_vfs_files:
-					print(f"[WebServer]   - {file_obj.name}")
+			# Look up the prepared response in the cached index; rebuild
+			# only when the index is stale (.find() is the official API
+			# for enumerating VFS files)
+			if _VFS_INDEX['comp_id'] != vfs_comp.id:
+				index = {}
+				for f in vfs_comp.vfs.find():
+					data = f.byteArray
+					# Content-derived tag: a size-based tag would keep
+					# revalidating stale assets after same-length edits
+					index[f.name] = {
+						'data': data,
+						'size': f.size,
+						'mime': getMimeType(f.name),
+						'etag': f'"{zlib.crc32(data):08x}"',
+					}
+				_VFS_INDEX['map'] = index
+				_VFS_INDEX['comp_id'] = vfs_comp.id
+
+			entry = _VFS_INDEX['map'].get(filename)
+
+			if entry is None:
+				# Keep 404s to a single dict probe - scanners hammer
+				# unknown paths, so even the log line is debug-only
+				_log("[WebServer] Error: File '%s' not found in VFS", filename)
+				if _DEBUG:
+					print(f"[WebServer] Available files:")
+					for name in _VFS_INDEX['map']:
+						print(f"[WebServer]   - {name}")
 				response['statusCode'] = 404
 				response['statusReason'] = 'Not Found'
 				response['data'] = f'File not found: {filename}'
 				return response
 
-			# Read file from VFS
-			file_data = vfs_file.byteArray
-			file_size = vfs_file.size
+			# Content-hash ETag lets browsers revalidate instead of
+			# re-downloading the body on every refresh. TD surfaces request
+			# headers as top-level dict keys; probe the nested form too.
+			etag = entry['etag']
+			if_none_match = request.get('If-None-Match') or request.get('headers', {}).get('If-None-Match')
+			if if_none_match == etag:
+				response['statusCode'] = 304
+				response['statusReason'] = 'Not Modified'
+				response['data'] = b''
+				response['ETag'] = etag
+				return response
 
-			# Set response
+			# Set response straight from the prepared entry - no MIME
+			# classification or byte re-fetch per request
 			response['statusCode'] = 200
 			response['statusReason'] = 'OK'
-			response['data'] = file_data
-			response['content-type'] = getMimeType(filename)
-
-			# Get client IP for logging
-			client_ip = request.get('clientAddress', 'unknown')
-
-			print("-" * 60)
-			print(f"[Web Server] GET /{filename}")
-			print(f"[Web Server] Client: {client_ip}")
-			print(f"[Web Server] ✓ Served: {filename} ({file_size} bytes, {response['content-type']})")
-			print("-" * 60)
+			response['data'] = entry['data']
+			response['content-type'] = entry['mime']
+			response['Content-Length'] = str(entry['size'])
+			response['ETag'] = etag
+			response['Cache-Control'] = 'public, max-age=300'
+
+			if _DEBUG:
+				# Get client IP for logging
+				client_ip = request.get('clientAddress', 'unknown')
+
+				print(_BANNER_DASH)
+				print(f"[Web Server] GET /{filename}")
+				print(f"[Web Server] Client: {client_ip}")
+				print(f"[Web Server] ✓ Served: {filename} ({entry['size']} bytes, {entry['mime']})")
+				print(_BANNER_DASH)
 
 			return response
 
 		except Exception as e:
-			print("-" * 60)
+			print(_BANNER_DASH)
 			print(f"[Web Server] GET {uri}")
 			print(f"[Web Server] Client: {request.get('clientAddress', 'unknown')}")
 			print(f"[Web Server] Error serving file: {e} Context:{parent().path}")
-			print("-" * 60)
+			print(_BANNER_DASH)
 			response['statusCode'] = 500
 			response['statusReason'] = 'Internal Server Error'
 			response['data'] = str(e)
 			return response
 
 
+# ============================================================================
+# OUTBOUND MESSAGE BATCHING
+# ============================================================================
+# Per-event webSocketSendText calls cost one TCP write each; for small
+# control frames the framing overhead dwarfs the payload. Handlers that
+# send replies should queue them via enqueueSend() and let a per-frame
+# tick drain the queue as one {"type": "batch", "msgs": [...]} frame per
+# client. Wire flushSendQueue() to an Execute DAT's onFrameEnd next to
+# the Web Server DAT. Bursts coalesce; an idle flush is a single
+# truthiness check. (The connect-time welcome stays immediate - it is a
+# one-off handshake, not a hot path.)
+
+_SEND_QUEUE = deque()
+
+
+def enqueueSend(webServerDAT, client, obj):
+	"""Queue an outbound message for the next flushSendQueue() tick."""
+	_SEND_QUEUE.append((webServerDAT, client, obj))
+
+
+def flushSendQueue():
+	"""Drain queued messages, sending one batched frame per client."""
+	if not _SEND_QUEUE:
+		return
+
+	batches = {}
+	while _SEND_QUEUE:
+		webServerDAT, client, obj = _SEND_QUEUE.popleft()
+		batches.setdefault((webServerDAT, client), []).append(obj)
+
+	for (webServerDAT, client), msgs in batches.items():
+		try:
+			webServerDAT.webSocketSendText(client, _dumps({'type': 'batch', 'msgs': msgs}))
+		except Exception as e:
+			print(f"[WebSocket] Error flushing batch to {client}: {e}")
+
+
 # ============================================================================
 # WEBSOCKET CALLBACKS (Control Messages)
 # ============================================================================
@@ -599,18 +1034,20 @@ def onWebSocketOpen(webServerDAT, client, uri):
 		client: Client info dictionary
 		uri: Requested URI
 	"""
-	print("=" * 60)
+	print(_BANNER_EQ)
 	print("[WebSocket] ✓ Client CONNECTED")
 	print(f"[WebSocket] URI: {uri}")
-	print("=" * 60)
+	print(_BANNER_EQ)
 
 	# Send welcome message
 	welcome = {
 		'type': 'connection',
 		'message': 'Connected to TouchDesigner WebSocket Server',
-		'timestamp': int(me.time.seconds * 1000)
+		# Direct C clock call - me.time.seconds reads back through the
+		# project time graph
+		'timestamp': time.monotonic_ns() // 1_000_000
 	}
-	webServerDAT.webSocketSendText(client, json.dumps(welcome))
+	webServerDAT.webSocketSendText(client, _dumps(welcome))
 
 
 def onWebSocketClose(webServerDAT, client):
@@ -621,9 +1058,9 @@ def onWebSocketClose(webServerDAT, client):
 		webServerDAT: The Web Server DAT operator
 		client: Client info dictionary
 	"""
-	print("=" * 60)
+	print(_BANNER_EQ)
 	print("[WebSocket] ✗ Client DISCONNECTED")
-	print("=" * 60)
+	print(_BANNER_EQ)
 
 
 def onWebSocketReceiveText(webServerDAT, client, data):
@@ -636,41 +1073,96 @@ def onWebSocketReceiveText(webServerDAT, client, data):
 		data: Received text message (JSON string)
 	"""
 
-	print("-" * 60)
-	print(f"[WebSocket] RAW MESSAGE RECEIVED:")
-	print(f"  Data: {data}")
-	print("-" * 60)
+	# Length gate before any parsing: real control messages are tiny,
+	# so an oversized frame is junk or abuse and not worth a parse
+	if len(data) > 4096:
+		print(f"[WebSocket] Oversized payload dropped ({len(data)} bytes)")
+		return
+
+	_log(_BANNER_DASH)
+	_log("[WebSocket] RAW MESSAGE RECEIVED:")
+	_log("  Data: %s", data)
+	_log(_BANNER_DASH)
+
+	# Compact slider frames skip the JSON tokenizer entirely:
+	# "p|<chop>|<label>|<value>". We control both ends of the wire, so
+	# a high-rate client may emit these for drags; JSON stays the
+	# compatibility path for everything else.
+	if data.startswith('p|'):
+		try:
+			_, chop_name, label, value = data.split('|', 3)
+			handleParameter({
+				'type': 'parameter',
+				'chop': chop_name,
+				'label': label,
+				'value': float(value),
+			})
+		except Exception as e:
+			print(f"[WebSocket] Bad compact frame: {e}")
+		return
 
+	msgType = ''
 	try:
-		message = json.loads(data)
+		message = _loads(data)
+
+		# Sanity check the shape: every known message is a flat dict
+		# with a handful of keys
+		if type(message) is not dict or len(message) > 16:
+			print("[WebSocket] Malformed message dropped")
+			return
+
 		msgType = message.get('type', '')
 
-		print(f"[WebSocket] Parsed Type: {msgType}")
-		print(f"[WebSocket] Full Data: {message}")
+		_log("[WebSocket] Parsed Type: %s", msgType)
+		_log("[WebSocket] Full Data: %s", message)
 
-		# Handle different message types
-		if msgType == 'parameter':
-			handleParameter(message)
+		# Dispatch via the handler table - one hash lookup per message
+		handler = _HANDLERS.get(msgType)
+		if handler is not None:
+			handler(message)
+		else:
+			print(f"[WebSocket] Unknown message type: {msgType}")
 
-		elif msgType == 'color':
-			handleColor(message)
+	except ValueError as e:
+		print(f"[WebSocket] JSON parse error: {e}")
+	except Exception as e:
+		print(f"[WebSocket] Error in '{msgType}' handler: {e}")
+
+
+# Lazily imported msgpack decoder for binary frames (stock TD Python
+# does not ship msgpack; text/JSON remains the default transport)
+_msgpack_unpackb = None
+
+
+def onWebSocketReceiveBinary(webServerDAT, client, data):
+	"""
+	Callback when WebSocket receives binary data.
 
-		elif msgType == 'xy':
-			handleXY(message)
+	Binary frames carry msgpack-encoded messages with the same schema as
+	the JSON text messages - no text decode, no JSON tokenizer.
+	"""
+	global _msgpack_unpackb
 
-		elif msgType == 'button':
-			handleButton(message)
+	if _msgpack_unpackb is None:
+		try:
+			import msgpack
+			_msgpack_unpackb = msgpack.unpackb
+		except ImportError:
+			print("[WebSocket] Binary frame received but msgpack is not installed")
+			return
 
-		elif msgType == 'reset':
-			handleReset(message)
+	try:
+		message = _msgpack_unpackb(data, raw=False)
+		msgType = message.get('type', '')
 
+		handler = _HANDLERS.get(msgType)
+		if handler is not None:
+			handler(message)
 		else:
 			print(f"[WebSocket] Unknown message type: {msgType}")
 
-	except json.JSONDecodeError as e:
-		print(f"[WebSocket] JSON parse error: {e}")
 	except Exception as e:
-		print(f"[WebSocket] Error handling message: {e}")
+		print(f"[WebSocket] Error handling binary message: {e}")
 
 
 # ============================================================================
@@ -697,59 +1189,58 @@ def handleParameter(data):
 		"value": 75.5
 	}
 	"""
-	try:
-		# Check for new format (with chop)
-		if 'chop' in data:
-			# New dynamic format - search by sanitized LABEL (not ID)
-			chop_name = data.get('chop', '')
-			value = data.get('value', 0)
-			control_label = data.get('label', data.get('id', 'unknown'))
-
-			# Use sanitized label for channel search (matches deployment)
-			sanitized_label = sanitizeName(control_label)
-
-			target_chop = op(chop_name)
-
-			if target_chop is None:
-				print(f"[WebSocket] Error: CHOP '{chop_name}' not found!")
-				return
-
-			# Search for channel by sanitized label
-			found = False
-			for i in range(target_chop.numChans):
-				if target_chop.par[f'const{i}name'].eval() == sanitized_label:
-					target_chop.par[f'const{i}value'] = value
-					found = True
-					print(f"[WebSocket] Set {chop_name}.{sanitized_label} = {value}")
-					break
-
-			if not found:
-				print(f"[WebSocket] Warning: Channel '{sanitized_label}' not found in {chop_name}")
+	# Check for new format (with chop)
+	if 'chop' in data:
+		# New dynamic format - search by sanitized LABEL (not ID)
+		chop_name = data.get('chop', '')
+		value = data.get('value', 0)
+		control_label = data.get('label', data.get('id', 'unknown'))
 
-		else:
-			# Legacy format support (old hardcoded slider1/2/3)
-			name = data.get('name', '')
-			value = data.get('value', 0)
-
-			constantChop = op('constant_params')
-
-			if constantChop is None:
-				print("[WebSocket] Error: constant_params CHOP not found!")
-				return
-
-			if name == 'slider1':
-				constantChop.par.value0 = value
-			elif name == 'slider2':
-				constantChop.par.value1 = value
-			elif name == 'slider3':
-				constantChop.par.value2 = value
+		# Use sanitized label for channel search (matches deployment)
+		sanitized_label = sanitizeName(control_label)
+
+		# Duplicate of the last write - skip the CHOP entirely
+		key = (chop_name, sanitized_label)
+		if _LAST_VALUE.get(key) == value:
+			return
+
+		target_chop = _getOp(chop_name)
+
+		if target_chop is None:
+			print(f"[WebSocket] Error: CHOP '{chop_name}' not found!")
+			return
+
+		# One dict hit instead of scanning const{i}name per message
+		idx = _chanIndexMap(target_chop).get(sanitized_label)
+		if idx is not None:
+			if _COALESCE_WRITES:
+				_PENDING[(chop_name, idx)] = value
 			else:
-				print(f"[WebSocket] Unknown parameter name: {name}")
+				target_chop.par[_VALUE_PARAMS[idx]] = value
+			_LAST_VALUE[key] = value
+			_log("[WebSocket] Set %s.%s = %s", chop_name, sanitized_label, value)
+		else:
+			print(f"[WebSocket] Warning: Channel '{sanitized_label}' not found in {chop_name}")
 
-			print(f"[WebSocket] Set {name} to {value} (legacy format)")
+	else:
+		# Legacy format support (old hardcoded slider1/2/3)
+		name = data.get('name', '')
+		value = data.get('value', 0)
+
+		constantChop = _getOp('constant_params')
+
+		if constantChop is None:
+			print("[WebSocket] Error: constant_params CHOP not found!")
+			return
+
+		attr = _LEGACY_SLIDER_MAP.get(name)
+		if attr is None:
+			print(f"[WebSocket] Unknown parameter name: {name}")
+			return
+
+		setattr(constantChop.par, attr, value)
+		_log("[WebSocket] Set %s to %s (legacy format)", name, value)
 
-	except Exception as e:
-		print(f"[WebSocket] Error in handleParameter: {e}")
 
 
 def handleColor(data):
@@ -772,61 +1263,71 @@ def handleColor(data):
 		"rgb": {"r": 1.0, "g": 0.0, "b": 0.0}
 	}
 	"""
+	# Well-formed messages always carry a full rgb dict - unpack in
+	# one shot and only fall back on malformed input
 	try:
-		rgb = data.get('rgb', {})
-		r = rgb.get('r', 0)
-		g = rgb.get('g', 0)
-		b = rgb.get('b', 0)
-
-		if 'chop' in data:
-			# New dynamic format - search by sanitized LABEL (not ID)
-			chop_name = data.get('chop', 'constant_color')
-			control_label = data.get('label', data.get('id', 'unknown'))
-
-			# Use sanitized label for channel search (matches deployment)
-			sanitized_label = sanitizeName(control_label)
-
-			colorChop = op(chop_name)
-
-			if colorChop is None:
-				print(f"[WebSocket] Error: CHOP '{chop_name}' not found!")
-				return
-
-			# Search for channels by sanitized label: {label}_r, {label}_g, {label}_b
-			channel_names = {
-				f'{sanitized_label}_r': r,
-				f'{sanitized_label}_g': g,
-				f'{sanitized_label}_b': b
-			}
-
-			found_count = 0
-			for i in range(colorChop.numChans):
-				chan_name = colorChop.par[f'const{i}name'].eval()
-				if chan_name in channel_names:
-					colorChop.par[f'const{i}value'] = channel_names[chan_name]
-					found_count += 1
-
-			if found_count == 3:
-				print(f"[WebSocket] Set {chop_name}.{sanitized_label}_[rgb] = R:{r:.2f} G:{g:.2f} B:{b:.2f}")
-			else:
-				print(f"[WebSocket] Warning: Only found {found_count}/3 color channels for '{sanitized_label}' in {chop_name}")
+		rgb = data['rgb']
+		r, g, b = rgb['r'], rgb['g'], rgb['b']
+	except (KeyError, TypeError):
+		r = g = b = 0
+
+	if 'chop' in data:
+		# New dynamic format - search by sanitized LABEL (not ID)
+		chop_name = data.get('chop', 'constant_color')
+		control_label = data.get('label', data.get('id', 'unknown'))
 
+		# Use sanitized label for channel search (matches deployment)
+		sanitized_label = sanitizeName(control_label)
+
+		# Duplicate of the last write - skip the CHOP entirely
+		key = (chop_name, sanitized_label)
+		if _LAST_VALUE.get(key) == (r, g, b):
+			return
+
+		colorChop = _getOp(chop_name)
+
+		if colorChop is None:
+			print(f"[WebSocket] Error: CHOP '{chop_name}' not found!")
+			return
+
+		# Channels named {label}_r, {label}_g, {label}_b - three direct
+		# index lookups and writes, no per-message loop or scan
+		chan_map = _chanIndexMap(colorChop)
+		idx_r = chan_map.get(f'{sanitized_label}_r')
+		idx_g = chan_map.get(f'{sanitized_label}_g')
+		idx_b = chan_map.get(f'{sanitized_label}_b')
+
+		found_count = 0
+		if idx_r is not None:
+			colorChop.par[_VALUE_PARAMS[idx_r]] = r
+			found_count += 1
+		if idx_g is not None:
+			colorChop.par[_VALUE_PARAMS[idx_g]] = g
+			found_count += 1
+		if idx_b is not None:
+			colorChop.par[_VALUE_PARAMS[idx_b]] = b
+			found_count += 1
+
+		if found_count == 3:
+			_LAST_VALUE[key] = (r, g, b)
+			_log("[WebSocket] Set %s.%s_[rgb] = R:%.2f G:%.2f B:%.2f", chop_name, sanitized_label, r, g, b)
 		else:
-			# Legacy format
-			colorChop = op('constant_color')
+			print(f"[WebSocket] Warning: Only found {found_count}/3 color channels for '{sanitized_label}' in {chop_name}")
 
-			if colorChop is None:
-				print("[WebSocket] Error: constant_color CHOP not found!")
-				return
+	else:
+		# Legacy format
+		colorChop = _getOp('constant_color')
 
-			colorChop.par.value0 = r
-			colorChop.par.value1 = g
-			colorChop.par.value2 = b
+		if colorChop is None:
+			print("[WebSocket] Error: constant_color CHOP not found!")
+			return
 
-			print(f"[WebSocket] Set color to R:{r:.2f} G:{g:.2f} B:{b:.2f} (legacy format)")
+		colorChop.par.value0 = r
+		colorChop.par.value1 = g
+		colorChop.par.value2 = b
+
+		_log("[WebSocket] Set color to R:%.2f G:%.2f B:%.2f (legacy format)", r, g, b)
 
-	except Exception as e:
-		print(f"[WebSocket] Error in handleColor: {e}")
 
 
 def handleXY(data):
@@ -849,57 +1350,70 @@ def handleXY(data):
 		"y": 0.50
 	}
 	"""
+	# Well-formed messages always carry both coordinates
 	try:
-		x = data.get('x', 0.5)
-		y = data.get('y', 0.5)
-
-		if 'chop' in data:
-			# New dynamic format - search by sanitized LABEL (not ID)
-			chop_name = data.get('chop', 'constant_xy')
-			control_label = data.get('label', data.get('id', 'unknown'))
-
-			# Use sanitized label for channel search (matches deployment)
-			sanitized_label = sanitizeName(control_label)
-
-			xyChop = op(chop_name)
-
-			if xyChop is None:
-				print(f"[WebSocket] Error: CHOP '{chop_name}' not found!")
-				return
-
-			# Search for channels by sanitized label: {label}_x, {label}_y
-			channel_names = {
-				f'{sanitized_label}_x': x,
-				f'{sanitized_label}_y': y
-			}
-
-			found_count = 0
-			for i in range(xyChop.numChans):
-				chan_name = xyChop.par[f'const{i}name'].eval()
-				if chan_name in channel_names:
-					xyChop.par[f'const{i}value'] = channel_names[chan_name]
-					found_count += 1
-
-			if found_count == 2:
-				print(f"[WebSocket] Set {chop_name}.{sanitized_label}_[xy] = X:{x:.2f} Y:{y:.2f}")
+		x, y = data['x'], data['y']
+	except KeyError:
+		x = y = 0.5
+
+	if 'chop' in data:
+		# New dynamic format - search by sanitized LABEL (not ID)
+		chop_name = data.get('chop', 'constant_xy')
+		control_label = data.get('label', data.get('id', 'unknown'))
+
+		# Use sanitized label for channel search (matches deployment)
+		sanitized_label = sanitizeName(control_label)
+
+		# Duplicate of the last write - skip the CHOP entirely
+		key = (chop_name, sanitized_label)
+		if _LAST_VALUE.get(key) == (x, y):
+			return
+
+		xyChop = _getOp(chop_name)
+
+		if xyChop is None:
+			print(f"[WebSocket] Error: CHOP '{chop_name}' not found!")
+			return
+
+		# Channels named {label}_x, {label}_y - two direct index
+		# lookups and writes, no per-message loop or scan
+		chan_map = _chanIndexMap(xyChop)
+		idx_x = chan_map.get(f'{sanitized_label}_x')
+		idx_y = chan_map.get(f'{sanitized_label}_y')
+
+		found_count = 0
+		if idx_x is not None:
+			if _COALESCE_WRITES:
+				_PENDING[(chop_name, idx_x)] = x
+			else:
+				xyChop.par[_VALUE_PARAMS[idx_x]] = x
+			found_count += 1
+		if idx_y is not None:
+			if _COALESCE_WRITES:
+				_PENDING[(chop_name, idx_y)] = y
 			else:
-				print(f"[WebSocket] Warning: Only found {found_count}/2 XY channels for '{sanitized_label}' in {chop_name}")
+				xyChop.par[_VALUE_PARAMS[idx_y]] = y
+			found_count += 1
 
+		if found_count == 2:
+			_LAST_VALUE[key] = (x, y)
+			_log("[WebSocket] Set %s.%s_[xy] = X:%.2f Y:%.2f", chop_name, sanitized_label, x, y)
 		else:
-			# Legacy format
-			xyChop = op('constant_xy')
+			print(f"[WebSocket] Warning: Only found {found_count}/2 XY channels for '{sanitized_label}' in {chop_name}")
 
-			if xyChop is None:
-				print("[WebSocket] Error: constant_xy CHOP not found!")
-				return
+	else:
+		# Legacy format
+		xyChop = _getOp('constant_xy')
 
-			xyChop.par.value0 = x
-			xyChop.par.value1 = y
+		if xyChop is None:
+			print("[WebSocket] Error: constant_xy CHOP not found!")
+			return
 
-			print(f"[WebSocket] Set XY to X:{x:.2f} Y:{y:.2f} (legacy format)")
+		xyChop.par.value0 = x
+		xyChop.par.value1 = y
+
+		_log("[WebSocket] Set XY to X:%.2f Y:%.2f (legacy format)", x, y)
 
-	except Exception as e:
-		print(f"[WebSocket] Error in handleXY: {e}")
 
 
 def handleButton(data):
@@ -921,54 +1435,53 @@ def handleButton(data):
 		"state": 1
 	}
 	"""
-	try:
-		control_label = data.get('label', data.get('id', 'unknown'))
-		state = data.get('state', 0)
-
-		# Use sanitized label for channel search (matches deployment)
-		sanitized_label = sanitizeName(control_label)
+	control_label = data.get('label', data.get('id', 'unknown'))
+	state = data.get('state', 0)
 
-		if 'chop' in data:
-			# New dynamic format - search by sanitized LABEL
-			chop_name = data.get('chop', 'button_states')
+	# Use sanitized label for channel search (matches deployment)
+	sanitized_label = sanitizeName(control_label)
 
-			buttonChop = op(chop_name)
+	if 'chop' in data:
+		# New dynamic format - search by sanitized LABEL
+		chop_name = data.get('chop', 'button_states')
 
-			if buttonChop is None:
-				print(f"[WebSocket] Error: CHOP '{chop_name}' not found!")
-				return
+		buttonChop = _getOp(chop_name)
 
-			# Find the channel for this button
-			# Button channels are named {sanitized_label}_state in deploy script
-			channel_name = f"{sanitized_label}_state"
+		if buttonChop is None:
+			print(f"[WebSocket] Error: CHOP '{chop_name}' not found!")
+			return
 
-			# Search for the channel by name
-			found = False
-			for i in range(buttonChop.numChans):
-				if buttonChop.par[f'const{i}name'].eval() == channel_name:
-					buttonChop.par[f'const{i}value'] = state
-					found = True
-					print(f"[WebSocket] Set {chop_name}.{channel_name} = {state}")
-					break
+		# Find the channel for this button
+		# Button channels are named {sanitized_label}_state in deploy script
+		channel_name = f"{sanitized_label}_state"
 
-			if not found:
-				print(f"[WebSocket] Warning: Channel '{channel_name}' not found in {chop_name}")
+		# Duplicate of the last write - skip the CHOP entirely
+		key = (chop_name, channel_name)
+		if _LAST_VALUE.get(key) == state:
+			return
 
+		# One dict hit instead of scanning const{i}name per message
+		idx = _chanIndexMap(buttonChop).get(channel_name)
+		if idx is not None:
+			buttonChop.par[_VALUE_PARAMS[idx]] = state
+			_LAST_VALUE[key] = state
+			_log("[WebSocket] Set %s.%s = %s", chop_name, channel_name, state)
 		else:
-			# Legacy format - use hardcoded button CHOP
-			buttonChop = op('button_states')
+			print(f"[WebSocket] Warning: Channel '{channel_name}' not found in {chop_name}")
+
+	else:
+		# Legacy format - use hardcoded button CHOP
+		buttonChop = _getOp('button_states')
 
-			if buttonChop is None:
-				print("[WebSocket] Error: button_states CHOP not found!")
-				return
+		if buttonChop is None:
+			print("[WebSocket] Error: button_states CHOP not found!")
+			return
 
-			# Assume first channel for legacy
-			buttonChop.par.value0 = state
+		# Assume first channel for legacy
+		buttonChop.par.value0 = state
 
-			print(f"[WebSocket] Set button state to {state} (legacy format)")
+		_log("[WebSocket] Set button state to %s (legacy format)", state)
 
-	except Exception as e:
-		print(f"[WebSocket] Error in handleButton: {e}")
 
 
 def handleReset(data):
@@ -981,37 +1494,61 @@ def handleReset(data):
 		"timestamp": 1234567890
 	}
 	"""
-	try:
-		# Reset sliders to 50 (middle position)
-		constantChop = op('constant_params')
-		if constantChop:
-			constantChop.par.value0 = 50
-			constantChop.par.value1 = 50
-			constantChop.par.value2 = 50
-
-		# Reset color to red
-		colorChop = op('constant_color')
-		if colorChop:
-			colorChop.par.value0 = 1.0  # R
-			colorChop.par.value1 = 0.0  # G
-			colorChop.par.value2 = 0.0  # B
-
-		# Reset XY to center
-		xyChop = op('constant_xy')
-		if xyChop:
-			xyChop.par.value0 = 0.5  # X
-			xyChop.par.value1 = 0.5  # Y
-
-		print("[WebSocket] Reset all parameters to defaults")
+	# One pass over the static reset table (missing CHOPs are skipped)
+	for path, defaults in _RESET_TABLE:
+		target = _getOp(path)
+		if target is None:
+			continue
+		target_par = target.par
+		for attr, value in defaults:
+			setattr(target_par, attr, value)
 
-	except Exception as e:
-		print(f"[WebSocket] Error in handleReset: {e}")
+	# Values changed underneath the handlers - drop the dedupe memo and
+	# any queued coalesced writes so they cannot overwrite the defaults
+	_LAST_VALUE.clear()
+	_PENDING.clear()
+
+	_log("[WebSocket] Reset all parameters to defaults")
+
+
+
+# Message-type dispatch table for onWebSocketReceiveText. Adding a new
+# message type means adding its handler here - no dispatcher edits.
+_HANDLERS = {
+	'parameter': handleParameter,
+	'color': handleColor,
+	'xy': handleXY,
+	'button': handleButton,
+	'reset': handleReset,
+}
 
 
 # ============================================================================
 # SERVER LIFECYCLE CALLBACKS
 # ============================================================================
 
+def _enableTcpNoDelay(webServerDAT):
+	"""
+	Best-effort TCP_NODELAY on the server socket (disables Nagle).
+
+	Small control frames from sliders/XY pads otherwise sit in the
+	kernel's Nagle timer (~40ms) before going out, which shows up as
+	control latency. The Web Server DAT does not expose its listening
+	socket publicly, so probe the known internal attributes and fail
+	quietly on builds where they are absent.
+	"""
+	import socket
+
+	try:
+		server = getattr(webServerDAT, '_server', None)
+		sock = getattr(server, '_sock', None) or getattr(server, 'socket', None)
+		if sock is not None:
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+			print("[WebServer] TCP_NODELAY enabled (Nagle disabled)")
+	except Exception as e:
+		print(f"[WebServer] Could not set TCP_NODELAY: {e}")
+
+
 def onServerStart(webServerDAT):
 	"""
 	Callback when the web server starts.
@@ -1019,14 +1556,16 @@ def onServerStart(webServerDAT):
 	Args:
 		webServerDAT: The Web Server DAT operator
 	"""
-	print("=" * 60)
+	_enableTcpNoDelay(webServerDAT)
+
+	print(_BANNER_EQ)
 	print("[WebServer] ✓ Web Server STARTED")
 	print(f"[WebServer] Port: {webServerDAT.par.port}")
 	print(f"[WebServer] Builder: http://localhost:{webServerDAT.par.port}/builder.html")
 	print(f"[WebServer] Viewer: http://localhost:{webServerDAT.par.port}/")
 	print(f"[WebServer] WebSocket: ws://localhost:{webServerDAT.par.port}")
 	print("[WebServer] ONE server handles HTTP + WebSocket!")
-	print("=" * 60)
+	print(_BANNER_EQ)
 
 
 def onServerStop(webServerDAT):
@@ -1036,6 +1575,6 @@ def onServerStop(webServerDAT):
 	Args:
 		webServerDAT: The Web Server DAT operator
 	"""
-	print("=" * 60)
+	print(_BANNER_EQ)
 	print("[WebServer] ✗ Web Server STOPPED")
-	print("=" * 60)
+	print(_BANNER_EQ)